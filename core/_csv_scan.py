@@ -0,0 +1,44 @@
+"""
+Compiled CSV Line Scanner for the Library of Jörmungandr
+
+Numba kernel used by csv_repair_tool.py to count quotes and
+quote-aware fields for every line of a file in one tight loop.
+
+Importing this module raises ImportError when Numba is not
+installed; callers fall back to the NumPy scanner in that case.
+"""
+
+from numba import njit
+
+@njit(cache=True, nogil=True, boundscheck=False)
+def scan(buf, starts, ends, out_quotes, out_fields):
+    """
+    Count quotes and fields for each line of a CSV buffer.
+
+    Line k covers buf[starts[k]:ends[k]]. Quote state is reset at
+    the start of every line, matching the per-line NumPy scanner.
+    Runs without the GIL so threads can scan disjoint ranges.
+
+    Args:
+        buf: uint8 array of the whole file
+        starts: int64 array of line start offsets
+        ends: int64 array of line end offsets (exclusive)
+        out_quotes: int64 array receiving quote count per line
+        out_fields: int64 array receiving field count per line
+    """
+    for k in range(starts.shape[0]):
+        inside = 0
+        quotes = 0
+        fields = 1 # Start with 1 field
+
+        for i in range(starts[k], ends[k]):
+            c = buf[i]
+            is_quote = 1 if c == 0x22 else 0
+            is_comma = 1 if c == 0x2C else 0
+
+            inside ^= is_quote # Toggle state
+            quotes += is_quote
+            fields += is_comma & (1 - inside) # Count comma only outside quotes
+
+        out_quotes[k] = quotes
+        out_fields[k] = fields
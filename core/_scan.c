@@ -0,0 +1,221 @@
+/*
+ * C CSV Line Scanner for the Library of Jörmungandr
+ *
+ * Optional extension used by csv_repair_tool.py to count quotes and
+ * quote-aware fields for every line of a file. Has the same interface
+ * as the Numba kernel in _csv_scan.py:
+ *
+ *     scan(buf, starts, ends, out_quotes, out_fields)
+ *
+ * On x86-64 CPUs with AVX2, each line is classified 32 bytes at a time:
+ * cmpeq/movemask give bit masks of quotes and commas, a prefix-XOR of
+ * the quote mask gives the inside-quotes state of every byte, and the
+ * counts are popcounts of the masks. Other CPUs use a scalar loop.
+ *
+ * Build with setuptools (any platform):
+ *     python core/build_scan.py
+ *
+ * or by hand (from the repository root):
+ *     cc -O3 -shared -fPIC $(python3-config --includes) \
+ *         core/_scan.c -o core/_scan$(python3-config --extension-suffix)
+ *
+ * tests/test_scan_backends.py checks it against the other scanners.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define HAVE_AVX2_DISPATCH 1
+#include <immintrin.h>
+#endif
+
+/* Count quotes and fields in one line, one byte at a time. */
+static void
+scan_line_scalar(const uint8_t *p, Py_ssize_t n, int64_t *out_quotes, int64_t *out_fields)
+{
+    int64_t quotes = 0;
+    int64_t fields = 1; /* Start with 1 field */
+    int inside = 0;
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        int is_quote = p[i] == '"';
+
+        inside ^= is_quote; /* Toggle state */
+        quotes += is_quote;
+        fields += (p[i] == ',') & !inside; /* Count comma only outside quotes */
+    }
+
+    *out_quotes = quotes;
+    *out_fields = fields;
+}
+
+#ifdef HAVE_AVX2_DISPATCH
+/* Bit i of the result is the XOR of bits 0..i of x. */
+static inline uint32_t
+prefix_xor32(uint32_t x)
+{
+    x ^= x << 1;
+    x ^= x << 2;
+    x ^= x << 4;
+    x ^= x << 8;
+    x ^= x << 16;
+    return x;
+}
+
+/* Count quotes and fields in one line, 32 bytes at a time. */
+__attribute__((target("avx2,popcnt")))
+static void
+scan_line_avx2(const uint8_t *p, Py_ssize_t n, int64_t *out_quotes, int64_t *out_fields)
+{
+    const __m256i quote = _mm256_set1_epi8('"');
+    const __m256i comma = _mm256_set1_epi8(',');
+
+    int64_t quotes = 0;
+    int64_t fields = 1; /* Start with 1 field */
+    uint32_t inside = 0; /* All ones while inside quotes */
+    Py_ssize_t i = 0;
+
+    for (; i + 32 <= n; i += 32) {
+        __m256i block = _mm256_loadu_si256((const __m256i *)(p + i));
+        uint32_t quote_mask = (uint32_t)_mm256_movemask_epi8(_mm256_cmpeq_epi8(block, quote));
+        uint32_t comma_mask = (uint32_t)_mm256_movemask_epi8(_mm256_cmpeq_epi8(block, comma));
+        uint32_t inside_mask = prefix_xor32(quote_mask) ^ inside;
+
+        quotes += __builtin_popcount(quote_mask);
+        fields += __builtin_popcount(comma_mask & ~inside_mask);
+
+        /* Carry the state of the last byte into the next block */
+        inside = (uint32_t)0 - (inside_mask >> 31);
+    }
+
+    for (; i < n; i++) {
+        int is_quote = p[i] == '"';
+
+        inside ^= (uint32_t)0 - (uint32_t)is_quote;
+        quotes += is_quote;
+        fields += (p[i] == ',') & !(inside & 1);
+    }
+
+    *out_quotes = quotes;
+    *out_fields = fields;
+}
+#endif
+
+typedef void (*scan_line_fn)(const uint8_t *, Py_ssize_t, int64_t *, int64_t *);
+
+static scan_line_fn scan_line = scan_line_scalar;
+
+/* Get a contiguous buffer of int64 values from an array argument. */
+static int
+get_int64_buffer(PyObject *obj, Py_buffer *view, int flags, const char *name)
+{
+    if (PyObject_GetBuffer(obj, view, flags | PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return -1;
+    }
+    if (view->itemsize != 8 || view->format == NULL
+            || (strcmp(view->format, "q") != 0 && strcmp(view->format, "l") != 0
+                && strcmp(view->format, "<q") != 0 && strcmp(view->format, "<l") != 0)) {
+        PyErr_Format(PyExc_TypeError, "%s must be an int64 array", name);
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+scan(PyObject *self, PyObject *args)
+{
+    PyObject *buf_obj, *starts_obj, *ends_obj, *quotes_obj, *fields_obj;
+    Py_buffer buf, starts, ends, quotes, fields;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "OOOOO:scan", &buf_obj, &starts_obj, &ends_obj, &quotes_obj, &fields_obj)) {
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(buf_obj, &buf, PyBUF_C_CONTIGUOUS) < 0) {
+        return NULL;
+    }
+    if (get_int64_buffer(starts_obj, &starts, PyBUF_SIMPLE, "starts") < 0) {
+        goto release_buf;
+    }
+    if (get_int64_buffer(ends_obj, &ends, PyBUF_SIMPLE, "ends") < 0) {
+        goto release_starts;
+    }
+    if (get_int64_buffer(quotes_obj, &quotes, PyBUF_WRITABLE, "out_quotes") < 0) {
+        goto release_ends;
+    }
+    if (get_int64_buffer(fields_obj, &fields, PyBUF_WRITABLE, "out_fields") < 0) {
+        goto release_quotes;
+    }
+
+    Py_ssize_t n_lines = starts.len / 8;
+    if (ends.len / 8 != n_lines || quotes.len / 8 != n_lines || fields.len / 8 != n_lines) {
+        PyErr_SetString(PyExc_ValueError, "starts, ends and output arrays must have the same length");
+        goto release_fields;
+    }
+
+    const uint8_t *data = (const uint8_t *)buf.buf;
+    const int64_t *line_starts = (const int64_t *)starts.buf;
+    const int64_t *line_ends = (const int64_t *)ends.buf;
+    int64_t *out_quotes = (int64_t *)quotes.buf;
+    int64_t *out_fields = (int64_t *)fields.buf;
+
+    for (Py_ssize_t k = 0; k < n_lines; k++) {
+        if (line_starts[k] < 0 || line_ends[k] < line_starts[k] || line_ends[k] > buf.len) {
+            PyErr_Format(PyExc_IndexError, "line %zd is outside the buffer", k);
+            goto release_fields;
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t k = 0; k < n_lines; k++) {
+        scan_line(data + line_starts[k], (Py_ssize_t)(line_ends[k] - line_starts[k]),
+                  &out_quotes[k], &out_fields[k]);
+    }
+    Py_END_ALLOW_THREADS
+
+    result = Py_None;
+    Py_INCREF(result);
+
+release_fields:
+    PyBuffer_Release(&fields);
+release_quotes:
+    PyBuffer_Release(&quotes);
+release_ends:
+    PyBuffer_Release(&ends);
+release_starts:
+    PyBuffer_Release(&starts);
+release_buf:
+    PyBuffer_Release(&buf);
+    return result;
+}
+
+static PyMethodDef scan_methods[] = {
+    {"scan", scan, METH_VARARGS,
+     "scan(buf, starts, ends, out_quotes, out_fields)\n\n"
+     "Count quotes and fields for each line buf[starts[k]:ends[k]]."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef scan_module = {
+    PyModuleDef_HEAD_INIT,
+    "_scan",
+    "C CSV line scanner (AVX2 with scalar fallback).",
+    -1,
+    scan_methods
+};
+
+PyMODINIT_FUNC
+PyInit__scan(void)
+{
+#ifdef HAVE_AVX2_DISPATCH
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("popcnt")) {
+        scan_line = scan_line_avx2;
+    }
+#endif
+    return PyModule_Create(&scan_module);
+}
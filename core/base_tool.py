@@ -10,6 +10,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+from config import LOG_FORMAT
+
 class BaseTool(ABC):
     """
     Abstract base class for all library tools.
@@ -17,6 +19,10 @@ class BaseTool(ABC):
     Provides standard structure, error handling, and logging.
     All tools must implement the abstract methods.
     """
+
+    # Shared across all tools, LOG_FORMAT holds no per-tool parts
+    _formatter = logging.Formatter(LOG_FORMAT)
+
     def __init__(self, name: str, version: str = "1.0.0"):
         """
         Initialize the base tool.
@@ -41,17 +47,16 @@ class BaseTool(ABC):
         logger = logging.getLogger(self.name)
         logger.setLevel(logging.INFO)
 
-        #Only add handler if this logger doesn't have any yet
+        # Only add handler if this logger doesn't have any yet
         if not logger.handlers:
             # Console handler
             handler = logging.StreamHandler(sys.stdout)
             handler.setLevel(logging.INFO)
 
-            # Format: [TOOL_NAME] MESSAGE
-            formatter = logging.Formatter(f'[{self.name}] %(message)s')
-            handler.setFormatter(formatter)
-
+            # Format from config.LOG_FORMAT, e.g. [TOOL_NAME] INFO: MESSAGE
+            handler.setFormatter(BaseTool._formatter)
             logger.addHandler(handler)
+
         return logger
     
     @abstractmethod
@@ -104,7 +109,27 @@ class BaseTool(ABC):
         
         except Exception as e:
             self.logger.error(f"Error during execution: {e}")
+            self.close() # Release anything validate_input() left open
             return None
+
+    def close(self) -> None:
+        """
+        Release resources held between validate_input() and process().
+
+        Tools that hold none don't need to override this.
+        """
+
+        pass
+
+    def __enter__(self) -> "BaseTool":
+        """Use the tool as a context manager, close() runs on exit."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the tool when leaving a with block."""
+
+        self.close()
         
     def get_info(self) -> Dict[str, str]:
         """
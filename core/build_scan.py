@@ -0,0 +1,54 @@
+"""
+Build Script for the C CSV Line Scanner
+
+Compiles the optional core/_scan.c extension in place, next to
+csv_repair_tool.py, which then prefers it over the Numba and NumPy
+scanners. Uses setuptools, so the platform's own compiler and flags
+are picked up.
+
+Usage (from any directory):
+    python core/build_scan.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CORE_DIR = Path(__file__).resolve().parent
+
+def build():
+    """
+    Compile _scan.c into an extension module in core/.
+
+    Returns:
+        bool: True if the build succeeded, False otherwise
+    """
+    try:
+        from setuptools import Extension, setup
+    except ImportError:
+        print("setuptools is required to build the C scanner: pip install setuptools")
+        return False
+
+    # MSVC takes its own optimization flags, everything else gets -O3
+    extra_args = [] if sys.platform == "win32" else ["-O3"]
+    extension = Extension("_scan", sources=["_scan.c"], extra_compile_args=extra_args)
+
+    # setuptools resolves sources and --inplace output relative to the working directory,
+    # intermediate files go to a temporary directory instead of core/build/
+    previous_dir = os.getcwd()
+    os.chdir(CORE_DIR)
+    try:
+        with tempfile.TemporaryDirectory() as build_dir:
+            setup(name="_scan", ext_modules=[extension],
+                  script_args=["build_ext", "--inplace", "--build-temp", build_dir, "--build-lib", build_dir])
+    except SystemExit as e:
+        print(f"Build failed: {e}")
+        return False
+    finally:
+        os.chdir(previous_dir)
+
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if build() else 1)
@@ -96,9 +96,24 @@ DATE_FORMAT = "%Y-%m-%d"
 # Default chunk size for processing large files (rows)
 CHUNK_SIZE = 1000
 
+# Maximum bytes per block in the NumPy structure scan, bounds its scratch memory
+SCAN_BLOCK_SIZE = 1024 * 1024 # 1 MB
+
+# Rows per chunk when streaming CSVs through pandas
+CSV_CHUNK_ROWS = 100_000
+
+# Bytes per block when streaming CSVs through pyarrow
+CSV_BLOCK_SIZE = 16 * 1024 * 1024 # 16 MB
+
 # Maximum number of errors before stopping
 MAX_ERRORS = 100
 
+# Split structure scans across threads for files at least this large
+MIN_PARALLEL_SCAN_SIZE = 4 * 1024 * 1024 # 4 MB
+
+# Clean columns across threads for chunks with at least this many rows
+MIN_PARALLEL_CLEAN_ROWS = 10_000
+
 # Default value for missing data
 DEFAULT_MISSING_VALUE = ""
 
@@ -9,15 +9,49 @@ This is a CORE tool - other tools can use it to ensure CSV files
 are structurally valid before attempting to process them.
 """
 
+import io
+import os
+import logging
+import mmap
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+import numpy as np
+
 # Import from other core modules
 from base_tool import BaseTool
-from config import DEFAULT_ENCODING, MAX_CSV_SIZE
-from utils import check_file_exists, get_file_size, bytes_to_human_readable
+from config import (DEFAULT_ENCODING, MAX_CSV_SIZE, WARN_FILE_SIZE, MIN_PARALLEL_SCAN_SIZE,
+                    CHUNK_SIZE, SCAN_BLOCK_SIZE, MAX_ERRORS, TEMP_DIR, TIMESTAMP_FORMAT)
+from utils import check_file_exists, create_directory, bytes_to_human_readable
 from user_input import edit_line_interactive, confirm_action
 
+# Optional compiled scanner: C extension (core/_scan.c), then numba,
+# falls back to NumPy
+try:
+    from _scan import scan as _scan_kernel
+except ImportError:
+    try:
+        from _csv_scan import scan as _scan_kernel
+    except ImportError:
+        _scan_kernel = None
+
+# Byte -> character class lookup table for _scan_line()
+_TOKEN, _QUOTE, _COMMA, _NEWLINE = 0, 1, 2, 3
+
+_CHAR_CLASS = np.zeros(256, dtype=np.uint8)
+_CHAR_CLASS[0x22] = _QUOTE # "
+_CHAR_CLASS[0x2C] = _COMMA # ,
+_CHAR_CLASS[0x0A] = _NEWLINE # \n
+
+class IssueType(IntEnum):
+    """Kinds of structural issue reported by CSVRepairTool."""
+    UNBALANCED_QUOTES = 1
+    FIELD_COUNT = 2
+
 class CSVRepairTool(BaseTool):
     """
     Repairs structural issues in CSV files.
@@ -28,17 +62,31 @@ class CSVRepairTool(BaseTool):
     Method Flow:
     1. __init__() - Initialize tool and stats tracking
     2. validate_input() - Verify file exists and is valid CSV
-    3. process() - Main repair workflow (read → detect → repair → return)
-    4. _has_unbalanced_quotes() - Check if line has paired quotes
-    5. _count_fields_respecting_quotes() - Count fields respecting CSV quoting rules
-    6. _detect_field_mismatches() - Find all lines with structural issues
-    7. _interactive_repair() - User-guided line-by-line repair
+    3. _release_validated() - Close the descriptor cached by validation
+    4. close() - Release the descriptor if validate_input() is not followed by process()
+    5. process() - Main repair workflow (read → detect → repair → return)
+    6. _line_offsets() - Find line start offsets in one vectorized scan
+    7. _write_repaired() - Stream the file with repaired lines substituted
+    8. _as_bytes() - View a line as a uint8 array
+    9. _scan_line() - Count quotes and fields in one vectorized pass
+    10. _has_unbalanced_quotes() - Check if line has paired quotes
+    11. _count_fields_respecting_quotes() - Count fields respecting CSV quoting rules
+    12. _scan_lines() - Count quotes and fields for every line at once
+    13. _scan_block() - Prefix-sum scan of consecutive lines (NumPy)
+    14. _scan_workspace() - Allocate scratch arrays reused by _scan_block()
+    15. _detect_field_mismatches() - Find all lines with structural issues
+    16. _detect_field_mismatches_parallel() - Split detection across threads
+    17. _check_lines() - Check a run of lines for quote and field issues
+    18. _describe_issue() - Format an issue description for display
+    19. _interactive_repair() - User-guided line-by-line repair
     """
     
     def __init__(self):
         """ Initialize the CSV Repair Tool."""
         super().__init__(name="CSV Repair Tool", version="1.0.0")
         self.repairs_made = 0
+        self.expected_fields = None
+        self._validated = None # Path, size and open fd from validate_input()
 
     def validate_input(self, filepath):
         """   
@@ -64,29 +112,71 @@ class CSVRepairTool(BaseTool):
         # Convert to Path object
         filepath = Path(filepath)
 
+        # Drop any descriptor left over from an earlier validation
+        self._release_validated()
+
         # Check if file exists
         if not check_file_exists(filepath):
             self.logger.error(f"File not found: {filepath}")
             return False
-        
+
         # Check if CSV file
         if filepath.suffix.lower() != '.csv':
             self.logger.error(f"File must be a CSV file, got: {filepath.suffix}")
             return False
-        
-        # Check file size
-        size = get_file_size(filepath)
-        if size is None:
+
+        # Open once and stat the descriptor, process() reuses both
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except FileNotFoundError:
+            self.logger.error(f"File not found: {filepath}")
+            return False
+        except OSError as e:
+            self.logger.error(f"Could not open file: {e}")
+            return False
+
+        try:
+            st = os.fstat(fd)
+        except OSError:
+            os.close(fd)
             self.logger.error("Could not determine file size")
             return False
-        
+
+        # Check again on the descriptor, the path may have been replaced since
+        if not stat.S_ISREG(st.st_mode):
+            os.close(fd)
+            self.logger.error(f"File not found: {filepath}")
+            return False
+
+        size = st.st_size
         if size > MAX_CSV_SIZE:
+            os.close(fd)
             self.logger.error(f"File too large: {bytes_to_human_readable(size)} (max: {bytes_to_human_readable(MAX_CSV_SIZE)})")
             return False
+
+        self._validated = {'path': filepath, 'size': size, 'fd': fd}
         
         self.logger.info(f"Input file validated: {filepath} ({bytes_to_human_readable(size)})")
         return True
 
+    def _release_validated(self):
+        """Close the descriptor cached by validate_input(), if any."""
+        validated = self._validated
+        self._validated = None
+
+        if validated is not None:
+            os.close(validated['fd'])
+
+    def close(self):
+        """
+        Release the descriptor kept by validate_input().
+
+        process() consumes it, so this only matters when a file is validated
+        without being processed (e.g. a dry check). Safe to call repeatedly,
+        and called by run() on errors and on leaving a with block.
+        """
+        self._release_validated()
+
     def process(self, filepath):
         """   
         Repair CSV structure issues before pandas parsing.
@@ -99,47 +189,192 @@ class CSVRepairTool(BaseTool):
             filepath: Path to the CSV file
 
         Returns:
-            str: Repaired CSV content as string, ready for pandas
+            str: Repaired CSV content as string, ready for pandas, for
+                 files under WARN_FILE_SIZE
+            Path: Path to the repaired CSV in TEMP_DIR for larger files
                  Returns None if file is empty or user cancels
         """
 
         filepath = Path(filepath)
 
-        self.logger.info("Starting CSV structure repair...")
+        log = self.logger
+        info_enabled = log.isEnabledFor(logging.INFO)
 
-        # Read the raw CSV content
-        with open(filepath, 'r', encoding=DEFAULT_ENCODING) as f:
-            lines = f.readlines()
+        log.info("Starting CSV structure repair...")
 
-        if not lines:
-            self.logger.error("CSV file is empty")
-            return None
-        
-        # Detect issues using two-layer detection
-        self.logger.info("Detecting field mismatches...")
-        issues = self._detect_field_mismatches(lines)
+        # Reuse the descriptor and size from validate_input() when present
+        validated = self._validated
+        self._validated = None
 
-        # Interactive repair if issues found
-        if issues:
-            self.logger.info(f"Found {len(issues)} lines needing repair")
-            lines = self._interactive_repair(lines, issues)
-
-            if lines is None:
-                self.logger.error("User cancelled repair process")
-                return None
-            
-            self.repairs_made = len(issues)
-        
+        if validated is not None and validated['path'] == filepath:
+            fd, size = validated['fd'], validated['size']
         else:
-            self.logger.info("No field mismatches detected! CSV structure looks good. Lucky you!")
+            if validated is not None:
+                os.close(validated['fd'])
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+            except OSError:
+                os.close(fd)
+                raise
+
+        # Memory-map the raw CSV content instead of reading it into a list
+        try:
+            if size == 0:
+                log.error("CSV file is empty")
+                return None
 
-        # Join lines back into single string
-        repaired_content = ''.join(lines)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                # Byte offset of each line start, plus end of file
+                line_starts = self._line_offsets(mm)
 
-        self.logger.info("CSV structure repair complete")
-        return repaired_content
+                # Detect issues using two-layer detection
+                log.info("Detecting field mismatches...")
+                issues = self._detect_field_mismatches(mm, line_starts)
+
+                repairs = {}
+
+                # Interactive repair if issues found
+                if issues:
+                    if info_enabled:
+                        log.info(f"Found {len(issues)} lines needing repair")
+                    repairs = self._interactive_repair(mm, line_starts, issues)
+
+                    if repairs is None:
+                        log.error("User cancelled repair process")
+                        return None
+                    
+                    self.repairs_made = len(issues)
+                
+                else:
+                    log.info("No field mismatches detected! CSV structure looks good. Lucky you!")
+
+                # Small files are returned in memory
+                if size < WARN_FILE_SIZE:
+                    output = io.BytesIO()
+                    self._write_repaired(output, mm, line_starts, repairs)
+                    repaired_content = output.getvalue().decode(DEFAULT_ENCODING)
+
+                    log.info("CSV structure repair complete")
+                    return repaired_content
+
+                # Larger files are streamed straight to disk
+                create_directory(TEMP_DIR)
+                timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+                output_path = TEMP_DIR / f"{filepath.stem}_repaired_{timestamp}.csv"
+
+                with open(output_path, 'wb') as output:
+                    self._write_repaired(output, mm, line_starts, repairs)
+
+        finally:
+            os.close(fd)
+
+        if info_enabled:
+            log.info(f"CSV structure repair complete, saved to: {output_path}")
+        return output_path
+
+    def _line_offsets(self, buf):
+        """
+        Find line boundaries in a CSV buffer with a single vectorized scan.
+
+        Lines end like in text mode: at \n, \r\n, or a bare \r.
+
+        Args:
+            buf: Bytes-like CSV content (bytes or mmap)
+
+        Returns:
+            np.ndarray: int64 byte offset of each line start, followed by
+                        the end of the buffer, so line i is
+                        buf[offsets[i]:offsets[i + 1]]
+        """
+        data = np.frombuffer(buf, dtype=np.uint8)
+        newlines = np.flatnonzero(data == 0x0A)
+
+        # A \r not followed by \n also ends a line (old Mac line endings)
+        if buf.find(b'\r') != -1:
+            returns = np.flatnonzero(data == 0x0D)
+            following = data[np.minimum(returns + 1, len(data) - 1)]
+            bare_returns = returns[(returns == len(data) - 1) | (following != 0x0A)]
+            if len(bare_returns):
+                newlines = np.union1d(newlines, bare_returns)
 
+        offsets = np.concatenate(([0], newlines + 1))
 
+        if offsets[-1] != len(buf):
+            offsets = np.append(offsets, len(buf)) # Last line has no newline
+
+        return offsets
+
+    def _write_repaired(self, out, mm, line_starts, repairs):
+        """
+        Write the CSV to a binary stream, substituting repaired lines.
+
+        Runs of untouched lines are copied straight from the mmap;
+        repaired lines keep their original line ending.
+
+        Args:
+            out: Binary file-like object to write to
+            mm: Memory-mapped CSV file
+            line_starts: Byte offset of each line start, plus end of file
+            repairs: Dict mapping line number (1-based) to fixed line text
+        """
+        position = 0
+
+        for line_num in sorted(repairs):
+            start = int(line_starts[line_num - 1])
+            end = int(line_starts[line_num])
+            original = mm[start:end]
+
+            out.write(mm[position:start])
+            out.write(repairs[line_num].encode(DEFAULT_ENCODING))
+            out.write(original[len(original.rstrip(b'\r\n')):]) # Keep line ending
+            position = end
+
+        out.write(mm[position:])
+
+    def _as_bytes(self, line):
+        """
+        View a CSV line as a uint8 array of its encoded bytes.
+
+        Args:
+            line: CSV line (str, or an existing uint8 array)
+
+        Returns:
+            np.ndarray: uint8 view of the line
+        """
+        if isinstance(line, str):
+            return np.frombuffer(line.encode(DEFAULT_ENCODING, 'surrogatepass'), dtype=np.uint8)
+        return line
+
+    def _scan_line(self, line):
+        """
+        Count quotes and fields in a CSV line in a single pass.
+
+        Commas inside quotes don't count as delimiters. Each byte is
+        decoded to a character class through a lookup table, then a
+        running count of quotes gives the inside/outside state at every
+        byte, so only commas with an even number of quotes before them
+        are delimiters.
+
+        Args:
+            line: uint8 array of the line's bytes
+
+        Returns:
+            tuple: (quote_count, field_count)
+        """
+        # Fast path: without quotes every comma is a delimiter
+        if 0x22 not in line:
+            return 0, 1 + int(np.count_nonzero(line == 0x2C))
+
+        classes = _CHAR_CLASS[line]
+        quotes_mask = classes == _QUOTE
+        quote_count = int(quotes_mask.sum())
+
+        running = np.cumsum(quotes_mask)
+        inside_quotes = np.bitwise_and(running, 1, out=running) # 1 while inside quotes
+        delimiters = np.logical_and(np.logical_not(inside_quotes), classes == _COMMA)
+
+        return quote_count, 1 + int(delimiters.sum()) # Start with 1 field
 
     def _has_unbalanced_quotes(self, line):
         """   
@@ -152,94 +387,334 @@ class CSVRepairTool(BaseTool):
             bool: True if unbalanced (odd count), False if balanced (even count)
         """
 
-        quote_count = line.count('"')
+        quote_count, _ = self._scan_line(self._as_bytes(line))
         return quote_count % 2 != 0 # Odd = unbalanced
     
     def _count_fields_respecting_quotes(self, line):
         """
         Count fields in a CSV line, respecting quoted sections.
 
-        Commas inside quotes don't count as delimiters.
-
         Args:
-            line: CSV line to analyze
+            line: CSV line to analyze (str, or a uint8 array of its bytes)
 
         Returns:
             int: Number of fields in the line
         """
-        inside_quotes = False
-        field_count = 1 # Start with 1 field
-
-        for char in line:
-            if char == '"':
-                inside_quotes = not inside_quotes # Toggle state
-            
-            elif char == ',' and not inside_quotes:
-                field_count += 1 # Count comma only outside quotes
-
+        _, field_count = self._scan_line(self._as_bytes(line))
         return field_count
     
     
-    def _detect_field_mismatches(self, lines):
+    def _scan_lines(self, buffer, line_starts, line_ends, quote_counts=None, field_counts=None, workspace=None):
+        """
+        Count quotes and fields for every line of a buffer.
+
+        Uses the compiled C or Numba kernel when available, otherwise
+        the vectorized prefix-sum scan in _scan_block().
+
+        Args:
+            buffer: uint8 array of the whole file
+            line_starts: int64 array of line start offsets
+            line_ends: int64 array of line end offsets (exclusive)
+            quote_counts: Optional int64 output array to reuse
+            field_counts: Optional int64 output array to reuse
+            workspace: Optional scratch arrays from _scan_workspace(), for the NumPy scan
+
+        Returns:
+            tuple: (quote_counts, field_counts) as int64 arrays
+        """
+        n_lines = len(line_starts)
+        if quote_counts is None:
+            quote_counts = np.empty(n_lines, dtype=np.int64)
+        if field_counts is None:
+            field_counts = np.empty(n_lines, dtype=np.int64)
+        quote_counts = quote_counts[:n_lines]
+        field_counts = field_counts[:n_lines]
+
+        if _scan_kernel is not None:
+            _scan_kernel(buffer, line_starts, line_ends, quote_counts, field_counts)
+            return quote_counts, field_counts
+
+        if n_lines > 0:
+            self._scan_block(buffer, line_starts, line_ends, quote_counts, field_counts, workspace)
+
+        return quote_counts, field_counts
+
+    def _scan_block(self, buffer, line_starts, line_ends, quote_counts, field_counts, workspace=None):
+        """
+        Count quotes and fields for a run of consecutive lines with no
+        per-line Python loop.
+
+        One pass over the run's bytes builds prefix sums of quotes and of
+        commas split by quote parity. A comma is a delimiter when the
+        quote parity at the comma matches the parity at its line start
+        (quote state resets on every line), so each line's counts are
+        differences of the prefix sums at its start and end offsets.
+
+        Args:
+            buffer: uint8 array of the whole file
+            line_starts: int64 array of line start offsets (consecutive lines)
+            line_ends: int64 array of line end offsets (exclusive)
+            quote_counts: int64 output array for quote count per line
+            field_counts: int64 output array for field count per line
+            workspace: Optional scratch arrays from _scan_workspace(), used
+                       when they are large enough for the block
+        """
+        low = int(line_starts[0])
+        data = buffer[low:int(line_ends[-1])]
+        n = len(data)
+
+        if workspace is None or len(workspace[0]) < n:
+            workspace = self._scan_workspace(n)
+        mask, odd, sums = workspace
+        mask = mask[:n]
+        odd = odd[:n]
+
+        # Exclusive prefix sums: index i counts bytes before offset low + i
+        cum_quotes, cum_even_commas, cum_odd_commas = sums[:, :n + 1]
+        sums[:, 0] = 0
+
+        quotes_mask = np.equal(data, 0x22, out=mask) # "
+        np.cumsum(quotes_mask, dtype=sums.dtype, out=cum_quotes[1:])
+        np.logical_xor.accumulate(quotes_mask, out=odd) # Parity after each byte
+
+        commas_mask = np.equal(data, 0x2C, out=mask) # ,
+        odd_commas = np.logical_and(commas_mask, odd, out=odd)
+        np.cumsum(odd_commas, dtype=sums.dtype, out=cum_odd_commas[1:])
+        even_commas = np.logical_xor(commas_mask, odd_commas, out=mask)
+        np.cumsum(even_commas, dtype=sums.dtype, out=cum_even_commas[1:])
+
+        starts = line_starts - low
+        ends = line_ends - low
+        starts_odd = (cum_quotes[starts] & 1).astype(bool)
+
+        quote_counts[:] = cum_quotes[ends] - cum_quotes[starts]
+        field_counts[:] = 1 + np.where(
+            starts_odd,
+            cum_odd_commas[ends] - cum_odd_commas[starts],
+            cum_even_commas[ends] - cum_even_commas[starts],
+        )
+
+    def _scan_workspace(self, n_bytes):
+        """
+        Allocate the scratch arrays _scan_block() needs for up to n_bytes.
+
+        Prefix sums fit in int32 below 2 GiB, halving their size.
+
+        Args:
+            n_bytes: Largest block byte span to scan
+
+        Returns:
+            tuple: (mask, parity, sums) - two bool arrays of n_bytes and a
+                   (3, n_bytes + 1) array for the prefix sums
+        """
+        sums_dtype = np.int32 if n_bytes < 2 ** 31 - 1 else np.int64
+
+        return (np.empty(n_bytes, dtype=bool), np.empty(n_bytes, dtype=bool),
+                np.empty((3, n_bytes + 1), dtype=sums_dtype))
+
+    def _detect_field_mismatches(self, mm, line_starts):
         """
         Detect lines with structural issues using two-layer detection.
 
         Layer 1: Check for unbalanced quotes
         Layer 2: Check for field count mismatches (quote-aware)
 
+        Large files are split across worker threads, see
+        _detect_field_mismatches_parallel(). Scanning stops at the
+        first issue past MAX_ERRORS.
+
         Args:
-            lines: List of CSV lines (including header)
+            mm: Memory-mapped CSV file (or any bytes-like buffer)
+            line_starts: Byte offset of each line start, plus end of file
 
         Returns:
-            List of tuples: (line_number, line_content, issue_type)
+            List of tuples: (line_number, issue_type, field_count)
+            where field_count is -1 for unbalanced quotes
         """
-        if len(lines) < 2:
+        log = self.logger
+
+        n_lines = len(line_starts) - 1
+        if n_lines < 2:
             return []
 
         # Get expected field count from header
-        header = lines[0]
-        expected_fields = self._count_fields_respecting_quotes(header)
+        header = np.frombuffer(mm, dtype=np.uint8, count=int(line_starts[1]))
+        _, expected_fields = self._scan_line(header)
+        self.expected_fields = expected_fields
         
-        self.logger.info(f"Header has {expected_fields} fields")
+        if log.isEnabledFor(logging.INFO):
+            log.info(f"Header has {expected_fields} fields")
+
+        n_workers = os.cpu_count() or 1
+        if n_workers > 1 and len(mm) >= MIN_PARALLEL_SCAN_SIZE:
+            issues, stopped = self._detect_field_mismatches_parallel(mm, line_starts, expected_fields, n_workers)
+        else:
+            # Check each data line (line 2 onwards, line numbers are 1-based)
+            issues, stopped = self._check_lines(mm, line_starts[1:], expected_fields, MAX_ERRORS)
+            issues = [(i + 2, issue_type, field_count) for i, issue_type, field_count in issues]
+
+        if stopped:
+            log.warning(f"Stopped scanning after {MAX_ERRORS} issues, later lines were not checked")
+
+        return issues
+
+    def _detect_field_mismatches_parallel(self, buf, line_starts, header_fields, n_workers=None):
+        """
+        Detect structural issues with data lines split across threads.
+
+        The data lines are cut into one disjoint byte range per worker,
+        each split falling on the line start nearest to i * len(buf) / N.
+        The scanners release the GIL, so the ranges run concurrently.
+
+        Args:
+            buf: Memory-mapped CSV file (or any bytes-like buffer)
+            line_starts: Byte offset of each line start, plus end of file
+            header_fields: Field count every data line should have
+            n_workers: Number of threads (default: os.cpu_count())
+
+        Returns:
+            tuple: (issues, stopped) - list of (line_number, issue_type, field_count)
+                   tuples, and True if MAX_ERRORS cut the scan or the list short
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        # Split points as indices into line_starts, header excluded
+        targets = [i * len(buf) // n_workers for i in range(1, n_workers)]
+        splits = np.searchsorted(line_starts, targets)
+        bounds = np.unique(np.clip(np.concatenate(([1], splits, [len(line_starts) - 1])), 1, len(line_starts) - 1))
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(self._check_lines, buf, line_starts[lo:hi + 1], header_fields, MAX_ERRORS)
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+
+            issues = []
+            stopped = False
+            for lo, future in zip(bounds[:-1], futures):
+                range_issues, range_stopped = future.result()
+                stopped |= range_stopped
+
+                # Chunk-local index -> 1-based line number
+                issues.extend((int(lo) + i + 1, issue_type, field_count) for i, issue_type, field_count in range_issues)
+
+        return issues[:MAX_ERRORS], stopped or len(issues) > MAX_ERRORS
+
+    def _check_lines(self, buf, line_starts, expected_fields, max_issues=MAX_ERRORS):
+        """
+        Check a run of consecutive lines against the expected field count.
+
+        Lines are scanned in blocks of up to CHUNK_SIZE lines and
+        SCAN_BLOCK_SIZE bytes (a longer line gets a block of its own),
+        into output and scratch arrays allocated once. A badly broken
+        file stops being scanned as soon as an issue past max_issues
+        is found.
+
+        Args:
+            buf: Bytes-like CSV content containing the lines
+            line_starts: Byte offset of each line start, plus end of the run
+            expected_fields: Field count every line should have
+            max_issues: Stop after this many issues
+
+        Returns:
+            tuple: (issues, stopped) - list of (index_in_run, issue_type, field_count)
+                   tuples, and True if there were more than max_issues
+        """
+        buffer = np.frombuffer(buf, dtype=np.uint8)
+        n_lines = len(line_starts) - 1
+
+        # Output and scratch arrays shared by every block
+        quote_buffer = np.empty(CHUNK_SIZE, dtype=np.int64)
+        field_buffer = np.empty(CHUNK_SIZE, dtype=np.int64)
+        workspace = self._scan_workspace(SCAN_BLOCK_SIZE) if _scan_kernel is None else None
 
         issues = []
 
-        # Check each data line
-        for i, line in enumerate(lines[1:], start=2): #Start at line 2
-            # Skip empty lines
-            if not line.strip():
-                continue
+        block_start = 0
+        while block_start < n_lines:
+            # Lines ending within SCAN_BLOCK_SIZE bytes of the block start, at least one
+            byte_limit = line_starts[block_start] + SCAN_BLOCK_SIZE
+            fitting_end = int(np.searchsorted(line_starts, byte_limit, side='right')) - 1
+            block_end = max(block_start + 1, min(block_start + CHUNK_SIZE, n_lines, fitting_end))
 
-            # Layer 1: Check quote balance
-            if self._has_unbalanced_quotes(line):
-                issues.append((i, line.strip(), "Unbalanced quotes"))
-                continue # Skip field count check if quotes are broken
+            block = line_starts[block_start:block_end + 1]
+            quote_counts, field_counts = self._scan_lines(buffer, block[:-1], block[1:], quote_buffer, field_buffer,
+                                                          workspace)
 
-            # Layer 2: Check field count
-            field_count = self._count_fields_respecting_quotes(line)
-            if field_count != expected_fields:
-                issues.append((i, line.strip(), f"Has {field_count} fields, expected {expected_fields}"))
+            # Only lines failing a check are sliced out of the buffer
+            suspects = np.flatnonzero((quote_counts & 1) | (field_counts != expected_fields))
 
-        return issues
+            for j in suspects:
+                start = block[j]
+                end = block[j + 1]
+
+                # Skip empty lines (a lone newline needs no slice to tell)
+                if end - start == 0 or (end - start == 1 and buf[start] == 0x0A):
+                    continue
+                if not buf[start:end].decode(DEFAULT_ENCODING, errors='replace').strip():
+                    continue # Unicode whitespace (e.g. NBSP) counts too, as with str.strip()
+
+                # Layer 1: Check quote balance
+                if quote_counts[j] % 2 != 0:
+                    issues.append((block_start + int(j), IssueType.UNBALANCED_QUOTES, -1))
 
-    def _interactive_repair(self, lines, issues):
+                # Layer 2: Check field count
+                elif field_counts[j] != expected_fields:
+                    issues.append((block_start + int(j), IssueType.FIELD_COUNT, int(field_counts[j])))
+
+                # One issue past the limit proves the list is incomplete
+                if len(issues) > max_issues:
+                    return issues[:max_issues], True
+
+            block_start = block_end
+
+        return issues, False
+
+    def _describe_issue(self, issue_type, field_count):
+        """
+        Build the human-readable description of a detected issue.
+
+        Args:
+            issue_type: IssueType of the issue
+            field_count: Field count found on the line (-1 if not counted)
+
+        Returns:
+            str: Description shown to the user
+        """
+        if issue_type == IssueType.UNBALANCED_QUOTES:
+            return "Unbalanced quotes"
+        return f"Has {field_count} fields, expected {self.expected_fields}"
+
+    def _interactive_repair(self, mm, line_starts, issues):
         """
         Guide user through fixing problematic lines interactively.
 
+        Line content and descriptions are only built for the lines
+        actually shown, so aborting early skips the rest.
+
         Args:
-            lines: List of all CSV lines
-            issues: List of tuples(line_number, line_content, issue_description)
+            mm: Memory-mapped CSV file (or any bytes-like buffer)
+            line_starts: Byte offset of each line start, plus end of file
+            issues: List of tuples(line_number, issue_type, field_count)
 
         Returns:
-            Modified lines list, or None if user cancels
+            Dict mapping line number to fixed line, or None if user cancels
         """
+        log = self.logger
+        info_enabled = log.isEnabledFor(logging.INFO)
+
+        repairs = {}
+
         print("\n" + "=" * 60)
         print(f"INTERACTIVE REPAIR MODE")
         print(f"Found {len(issues)} lines with structural issues")
         print("=" * 60)
 
-        for line_num, line_content, issue_desc in issues:
-            print(f"\nLine {line_num}: {issue_desc}")
+        for line_num, issue_type, field_count in issues:
+            line_content = mm[line_starts[line_num - 1]:line_starts[line_num]].strip().decode(DEFAULT_ENCODING)
+
+            print(f"\nLine {line_num}: {self._describe_issue(issue_type, field_count)}")
             print(f"Content: {line_content}")
 
             # Ask user if they want to fix this line
@@ -249,7 +724,8 @@ class CSVRepairTool(BaseTool):
             )
 
             if not should_fix:
-                self.logger.info(f"Skipping line {line_num}")
+                if info_enabled:
+                    log.info(f"Skipping line {line_num}")
                 continue
 
             # Let user edit the line
@@ -266,11 +742,12 @@ class CSVRepairTool(BaseTool):
                 else:
                     continue
 
-            # Update the line (add newline back)
-            lines[line_num - 1] = fixed_line + '\n'
-            self.logger.info(f"Repaired line {line_num}")
+            # Record the fix (line ending is restored on write)
+            repairs[line_num] = fixed_line
+            if info_enabled:
+                log.info(f"Repaired line {line_num}")
 
-        return lines
+        return repairs
 
     """def _repair_csv_structure(self, filepath):
         
@@ -14,6 +14,12 @@ These functions provide a consistent interface for:
 import sys
 from typing import List, Optional, Dict, Any, Tuple
 
+# Optional: prompt_toolkit gives editable prefilled text
+try:
+    from prompt_toolkit import prompt as _pt_prompt
+except ImportError:
+    _pt_prompt = None
+
 def confirm_action(message: str, default: bool = True) -> bool:
     """   
     Ask user to confirm an action with yes/no.
@@ -34,22 +40,23 @@ def confirm_action(message: str, default: bool = True) -> bool:
     default_indicator = "[Y/n]" if default else "[y/N]"
     prompt_text = f"{message} {default_indicator}: "
 
-    # Get user input
-    response = input(prompt_text).strip().lower()
+    while True:
+        # Get user input
+        response = input(prompt_text).strip().lower()
 
-    # Handle empty response (use default)
-    if not response:
-        return default
-    
-    # Check for yes/no
-    if response in ['y', 'yes']:
-        return True
-    elif response in ['n', 'no']:
-        return False
-    else:
-        # Invalid input, ask again
-        print("Invalid input. Please enter 'y' or 'n'")
-        return confirm_action(message, default)
+        # Handle empty response (use default)
+        if not response:
+            return default
+        
+        # Check for yes/no
+        if response in ['y', 'yes']:
+            return True
+        elif response in ['n', 'no']:
+            return False
+        else:
+            # Invalid input, ask again
+            print("Invalid input. Please enter 'y' or 'n'")
+            continue
     
 def choose_from_list(options: List[str], message: str, allow_multiple: bool = False) -> Optional[List[int]]:
     """   
@@ -69,53 +76,54 @@ def choose_from_list(options: List[str], message: str, allow_multiple: bool = Fa
         >>> if choices and choices[0] == 0:
         >>>     skip_row()
     """    
-    # Display the message
-    print("\n" + "=" * 60)
-    print(message)
-    print("=" * 60)
-
-    # Display numbered options
-    for i, option in enumerate(options, start=1):
-        print(f"  {i}. {option}")
-        
-    # Add cancel options
-    print(f"  0. Cancel")
-    print("=" * 60)
-
-    # Get user choice
-    if allow_multiple:
-        prompt_text = "Enter choices (comma-separated, e.g. '1,3'): "
-    else:
-        prompt_text = "Enter choice: "
-
-    response = input(prompt_text).strip()
+    while True:
+        # Display the message
+        print("\n" + "=" * 60)
+        print(message)
+        print("=" * 60)
+
+        # Display numbered options
+        for i, option in enumerate(options, start=1):
+            print(f"  {i}. {option}")
+            
+        # Add cancel options
+        print(f"  0. Cancel")
+        print("=" * 60)
 
-    # Handle cancel
-    if response == '0' or response.lower() in ['cancel', 'c', 'q', 'quit']:
-        return None
-    
-    # Parse response
-    try:
+        # Get user choice
         if allow_multiple:
-            # Split by comma and convert to integers
-            choices = [int(x.strip()) for x in response.split(',')]
+            prompt_text = "Enter choices (comma-separated, e.g. '1,3'): "
         else:
-            # Single choice
-            choices = [int(response)]
+            prompt_text = "Enter choice: "
+
+        response = input(prompt_text).strip()
+
+        # Handle cancel
+        if response == '0' or response.lower() in ['cancel', 'c', 'q', 'quit']:
+            return None
+        
+        # Parse response
+        try:
+            if allow_multiple:
+                # Split by comma and convert to integers
+                choices = [int(x.strip()) for x in response.split(',')]
+            else:
+                # Single choice
+                choices = [int(response)]
+
+        except ValueError:
+            print("Invalid input. Please enter numbers only.")
+            continue
 
         # Validate choices are in range(1 to len(options))
-        for choice in choices:
-            if choice < 1 or choice > len(options):
-                print(f"Invalid choice :{choice}. Must be between 1 and {len(options)}")
-                return choose_from_list(options, message, allow_multiple)
+        invalid = [choice for choice in choices if choice < 1 or choice > len(options)]
+        if invalid:
+            print(f"Invalid choice :{invalid[0]}. Must be between 1 and {len(options)}")
+            continue
             
         # Convert to 0-based indices
         return [c - 1 for c in choices]
     
-    except ValueError:
-        print("Invalid input. Please enter numbers only.")
-        return choose_from_list(options, message, allow_multiple)
-    
 def edit_text_interactive(text: str, message: str = "Edit the text below:") -> Optional[str]:
     """
     Allow user to interactively edit text.
@@ -141,21 +149,19 @@ def edit_text_interactive(text: str, message: str = "Edit the text below:") -> O
     print(message)
     print("=" * 60)
 
-    # Try to use prompt_toolkit for best UX
-    try:
-        from prompt_toolkit import prompt
-
+    # Use prompt_toolkit for best UX if available
+    if _pt_prompt is not None:
         print("(Edit the text below, press Enter when done, Ctrl+C to cancel.)")
         print()
 
         try: 
-            edited = prompt("", default=text)
+            edited = _pt_prompt("", default=text)
             return edited if edited else None
         except KeyboardInterrupt:
             print("\nEdit cancelled.")
             return None
         
-    except ImportError:
+    else:
         # Fallback: show text and ask user to type new version
         print("Current text:")
         print(f"  {text}")
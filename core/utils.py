@@ -6,11 +6,19 @@ These functions provide common operations like file handling,
 validation, and data transformation.
 """
 
+import math
+import os
 import re
 import urllib.parse
 from pathlib import Path
 from typing import Optional, Union
 
+# Basic email shape used by validate_email(), compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Runs of whitespace (spaces, tabs, newlines) collapsed by clean_string()
+_WS_RE = re.compile(r'\s+')
+
 def check_file_exists(filepath: Union[str, Path]) ->bool:
     """
     Check if a file exists at the given path.
@@ -89,14 +97,15 @@ def is_safe_path(filepath: Union[str, Path], base_dir: Optional[Union[str, Path]
         bool: True if path is safe, False otherwise
     """
     if base_dir is None:
-        base_dir = Path.cwd()
+        base_dir = os.getcwd()
 
     try:
-        base = Path(base_dir).resolve()
-        target = (Path(base_dir) / filepath).resolve()
+        # Resolve each path once, as plain strings
+        base = os.path.realpath(base_dir)
+        target = os.path.realpath(os.path.join(base_dir, filepath))
 
         # Check if the target is within base directory
-        return target.is_relative_to(base)
+        return os.path.commonpath([base, target]) == base
     except (ValueError, OSError):
         return False
 
@@ -110,8 +119,7 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if email looks valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 def validate_url(url: str) -> bool:
     """
@@ -139,14 +147,9 @@ def clean_string(text: str) -> str:
     Returns:
         str: Cleaned string
     """
-    # Replace tabs and newlines with spaces
-    text = text.replace('\t', ' ').replace('\n', ' ').replace('\r',' ')
-
-    # Remove multiple consecutive spaces
-    text = ' '.join(text.split())
-
-    # Remove leading/trailing whitespace
-    return text.strip()
+    # Collapse tabs, newlines and repeated spaces to one space, then
+    # remove leading/trailing whitespace
+    return _WS_RE.sub(' ', text).strip()
 
 def normalize_whitespace(text: str) -> str:
     """
@@ -180,11 +183,13 @@ def bytes_to_human_readable(size_bytes: int) -> str:
     """
     
     units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    size = float(size_bytes)
     unit_index = 0
 
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    # Each unit is 2**10 larger, so the unit comes straight from the
+    # binary exponent (exact, unlike rounding math.log near a boundary)
+    if size_bytes >= 1024:
+        unit_index = min((math.frexp(size_bytes)[1] - 1) // 10, len(units) - 1)
+
+    size = size_bytes / (1024 ** unit_index)
 
     return f"{size:.2f} {units[unit_index]}"
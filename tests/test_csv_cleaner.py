@@ -0,0 +1,81 @@
+"""
+Regression tests for tools/Unreleased/01_csv_cleaner/csv_cleaner.py
+
+Runs under pytest, or directly: python tests/test_csv_cleaner.py
+"""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "core"))
+sys.path.insert(0, str(ROOT / "tools" / "Unreleased" / "01_csv_cleaner"))
+
+import csv_cleaner
+from csv_cleaner import CSVCleaner
+
+logging.disable(logging.CRITICAL)
+
+
+def write_chunks(chunks, path):
+    """Save chunks to one file the way _clean_chunks() does and return its bytes."""
+    tool = CSVCleaner()
+    for i, chunk in enumerate(chunks):
+        tool._save_cleaned_file(chunk, path, header=i == 0)
+    return path.read_bytes()
+
+
+def test_arrow_and_pandas_writers_give_the_same_bytes():
+    if csv_cleaner.pacsv is None:
+        print("pyarrow is not installed, skipped")
+        return
+
+    plain = pd.DataFrame({
+        'Customer Name': ['Alice', ' lead', 'trail ', 'Zoë', '', "It's", ' '],
+        'Price': [0.0, 1299.99, 1e-05, 1.2345678901234568e+17, np.nan, 25.5, -0.0],
+        'Quantity': [1, 'x', 2.5, '', None, True, 3],
+    })
+    needs_quoting = plain.assign(**{'Customer Name': ['a,b', 'say "hi"', 'two\nlines', 'c\rd', '', 'x', 'y']})
+    frames = {
+        'plain': [plain, plain],
+        'needs quoting': [plain, needs_quoting, plain],
+        'single column': [plain[['Customer Name']]],
+        'header only': [plain.head(0)],
+    }
+
+    saved_pacsv = csv_cleaner.pacsv
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, chunks in frames.items():
+            path = Path(tmp) / "out.csv"
+            try:
+                arrow = write_chunks(chunks, path)
+                csv_cleaner.pacsv = None
+                pandas = write_chunks(chunks, path)
+            finally:
+                csv_cleaner.pacsv = saved_pacsv
+
+            assert arrow == pandas, name
+
+
+def test_keyword_overlaps_keep_the_baseline_casing():
+    # The baseline cased name, then email, then status columns, the last pass won
+    columns = pd.Index(['Email_Status', 'Status_Email', 'Name_Email', 'Email_Name',
+                        'Name_Status', 'Customer_Name', 'Email', 'Notes'])
+    categories, _ = CSVCleaner()._classify_columns(columns)
+
+    assert categories == {
+        'Email_Status': 'title', 'Status_Email': 'title', 'Name_Email': 'email', 'Email_Name': 'email',
+        'Name_Status': 'title', 'Customer_Name': 'title', 'Email': 'email', 'Notes': 'other',
+    }
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
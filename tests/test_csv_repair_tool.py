@@ -0,0 +1,146 @@
+"""
+Regression tests for core/csv_repair_tool.py
+
+Runs under pytest, or directly: python tests/test_csv_repair_tool.py
+"""
+
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# core modules import each other by name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "core"))
+
+from config import MAX_ERRORS
+from csv_repair_tool import CSVRepairTool, IssueType
+
+logging.disable(logging.CRITICAL)
+
+
+def detect(data):
+    """Run structure detection on raw CSV bytes."""
+    tool = CSVRepairTool()
+    return tool._detect_field_mismatches(data, tool._line_offsets(data))
+
+
+def test_line_endings_are_equivalent():
+    # Same file with LF, CRLF and CR-only line endings
+    expected = [(2, IssueType.FIELD_COUNT, 1), (3, IssueType.FIELD_COUNT, 3)]
+
+    for ending in (b'\n', b'\r\n', b'\r'):
+        data = ending.join([b'a,b', b'1', b'1,2,3', b'4,5']) + ending
+        assert detect(data) == expected, ending
+
+
+def test_mixed_line_endings_split_like_text_mode():
+    tool = CSVRepairTool()
+    data = b'a,b\r1,2\n3\r\n4,5,6\r'
+
+    offsets = tool._line_offsets(data)
+    lines = [data[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    assert lines == [b'a,b\r', b'1,2\n', b'3\r\n', b'4,5,6\r']
+
+
+def test_whitespace_only_lines_are_skipped():
+    # Spaces, a tab and non-ASCII whitespace (NBSP, ideographic space) in UTF-8
+    data = b'a,b\n   \n\t\n\xc2\xa0\n\xe3\x80\x80 \n1,2\n'
+    assert detect(data) == []
+
+
+def test_stopped_only_past_max_errors():
+    tool = CSVRepairTool()
+
+    for n_bad, expected_stopped in ((MAX_ERRORS, False), (MAX_ERRORS + 1, True)):
+        data = b'a,b\n' + b'1\n' * n_bad + b'1,2\n' * 50
+        line_starts = tool._line_offsets(data)
+
+        issues, stopped = tool._check_lines(data, line_starts[1:], 2, MAX_ERRORS)
+        assert (len(issues), stopped) == (MAX_ERRORS, expected_stopped), n_bad
+
+        issues, stopped = tool._detect_field_mismatches_parallel(data, line_starts, 2, n_workers=3)
+        assert (len(issues), stopped) == (MAX_ERRORS, expected_stopped), n_bad
+
+
+def test_issues_on_the_last_line_do_not_count_as_stopped():
+    tool = CSVRepairTool()
+    data = b'a,b\n' + b'1\n' * MAX_ERRORS
+    line_starts = tool._line_offsets(data)
+
+    assert tool._check_lines(data, line_starts[1:], 2, MAX_ERRORS)[1] is False
+
+
+def is_open(fd):
+    """Check whether a file descriptor is still open."""
+    try:
+        os.fstat(fd)
+    except OSError:
+        return False
+    return True
+
+
+def test_validated_descriptor_is_released():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.csv"
+        path.write_bytes(b'a,b\n1,2\n')
+
+        # Validated but never processed
+        tool = CSVRepairTool()
+        assert tool.validate_input(path)
+        fd = tool._validated['fd']
+        tool.close()
+        assert not is_open(fd)
+        tool.close() # Closing twice is harmless
+
+        # Leaving a with block closes it too
+        with CSVRepairTool() as tool:
+            tool.validate_input(path)
+            fd = tool._validated['fd']
+        assert not is_open(fd)
+
+        # So does an error raised in run() after validation
+        tool = CSVRepairTool()
+        validate = tool.validate_input
+
+        def validate_and_fail(filepath):
+            nonlocal fd
+            validate(filepath)
+            fd = tool._validated['fd']
+            raise RuntimeError("failure after validation")
+
+        tool.validate_input = validate_and_fail
+        assert tool.run(path) is None
+        assert not is_open(fd)
+
+
+class RecordingLogger:
+    """Stand-in logger that keeps the error messages."""
+
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+
+def test_missing_file_is_reported_before_its_extension():
+    with tempfile.TemporaryDirectory() as tmp:
+        text_file = Path(tmp) / "notes.txt"
+        text_file.write_bytes(b'a,b\n')
+
+        for path, expected in ((Path(tmp) / "foo.txt", "File not found"),
+                               (Path(tmp) / "foo.csv", "File not found"),
+                               (text_file, "File must be a CSV file")):
+            tool = CSVRepairTool()
+            tool.logger = RecordingLogger()
+            assert not tool.validate_input(path)
+            assert tool.logger.errors[0].startswith(expected), path
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,131 @@
+"""
+Cross-check the CSV line scanners used by core/csv_repair_tool.py
+
+Every importable backend (C extension, Numba kernel, NumPy prefix-sum
+scan) must give the same per-line quote and field counts as a plain
+Python reference. Backends that aren't built/installed are skipped.
+Build the C one first with: python core/build_scan.py
+
+Runs under pytest, or directly: python tests/test_scan_backends.py
+"""
+
+import logging
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# core modules import each other by name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "core"))
+
+import csv_repair_tool
+from config import CHUNK_SIZE
+from csv_repair_tool import CSVRepairTool
+
+logging.disable(logging.CRITICAL)
+
+
+def load_backends():
+    """Map backend name -> scan(buf, starts, ends, out_quotes, out_fields) for each importable one."""
+    backends = {"numpy": lambda *args: CSVRepairTool()._scan_block(*args)}
+
+    try:
+        from _scan import scan
+        backends["c"] = scan
+    except ImportError:
+        pass
+
+    try:
+        from _csv_scan import scan
+        backends["numba"] = scan
+    except ImportError:
+        pass
+
+    return backends
+
+
+def reference_counts(line):
+    """Count quotes and quote-aware fields of one line, byte by byte."""
+    quotes = 0
+    fields = 1
+    inside = False
+
+    for byte in line:
+        if byte == 0x22:
+            quotes += 1
+            inside = not inside
+        elif byte == 0x2C and not inside:
+            fields += 1
+
+    return quotes, fields
+
+
+def random_csv(rng, n_lines, max_length=120):
+    """Build a buffer of n_lines random lines, many of them longer than 32 bytes."""
+    alphabet = b'ab,,,""" \xc3\xa9'
+    lines = [bytes(rng.choice(alphabet) for _ in range(rng.randint(0, max_length))) for _ in range(n_lines)]
+    buf = b'\n'.join(lines) + b'\n'
+
+    ends = np.cumsum([len(line) + 1 for line in lines], dtype=np.int64) - 1 # Exclude the newline
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64)
+    return buf, lines, starts, ends
+
+
+def test_backends_match_reference():
+    rng = random.Random(0)
+
+    for trial in range(50):
+        buf, lines, starts, ends = random_csv(rng, rng.randint(1, 200))
+        expected = np.array([reference_counts(line) for line in lines], dtype=np.int64)
+
+        for name, scan in load_backends().items():
+            quote_counts = np.empty(len(lines), dtype=np.int64)
+            field_counts = np.empty(len(lines), dtype=np.int64)
+            scan(np.frombuffer(buf, dtype=np.uint8), starts, ends, quote_counts, field_counts)
+
+            assert (quote_counts == expected[:, 0]).all(), (name, trial)
+            assert (field_counts == expected[:, 1]).all(), (name, trial)
+
+
+def test_backends_agree_across_blocks():
+    # More data lines than CHUNK_SIZE, so _check_lines scans several blocks
+    rng = random.Random(1)
+    buf, lines, _, _ = random_csv(rng, 2 * CHUNK_SIZE + 17, max_length=60)
+    buf = b'a,b,c\n' + buf
+
+    tool = CSVRepairTool()
+    line_starts = tool._line_offsets(buf)
+
+    # Default byte cap, and one below the line length (lines get blocks of their own)
+    results = {}
+    saved_kernel, saved_block_size = csv_repair_tool._scan_kernel, csv_repair_tool.SCAN_BLOCK_SIZE
+    try:
+        for name, scan in load_backends().items():
+            for block_size in (saved_block_size, 16):
+                csv_repair_tool._scan_kernel = None if name == "numpy" else scan
+                csv_repair_tool.SCAN_BLOCK_SIZE = block_size
+                results[name, block_size], _ = tool._check_lines(buf, line_starts[1:], 3, max_issues=len(lines))
+    finally:
+        csv_repair_tool._scan_kernel, csv_repair_tool.SCAN_BLOCK_SIZE = saved_kernel, saved_block_size
+
+    expected = []
+    for i, line in enumerate(lines):
+        quotes, fields = reference_counts(line)
+        if not line.strip():
+            continue
+        if quotes % 2:
+            expected.append((i, csv_repair_tool.IssueType.UNBALANCED_QUOTES, -1))
+        elif fields != 3:
+            expected.append((i, csv_repair_tool.IssueType.FIELD_COUNT, fields))
+
+    for name, issues in results.items():
+        assert issues == expected, name
+
+
+if __name__ == "__main__":
+    print(f"Backends: {', '.join(load_backends())}")
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -10,8 +10,8 @@ print("\nName column dtype:", df['Name'].dtype)
 print("Email column dtype:", df['Email'].dtype)
 
 # Try the transformation
-df['Name'] = df['Name'].apply(lambda x: x.title() if pd.notna(x) and isinstance(x, str) else x)
-df['Email'] = df['Email'].apply(lambda x: x.lower() if pd.notna(x) and isinstance(x, str) else x)
+df['Name'] = df['Name'].str.title()
+df['Email'] = df['Email'].str.lower()
 
 print("\nAFTER:")
 print(df)
\ No newline at end of file
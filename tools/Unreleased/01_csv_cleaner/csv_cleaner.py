@@ -7,7 +7,11 @@ Clean messy CSV files by removing duplicates, handling missing values,
 cleaning whitespace, and ensuring data consistency.
 """
 
+import codecs
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -16,10 +20,68 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "core"))
 
 from base_tool import BaseTool
 from utils import check_file_exists, get_file_size, create_directory, clean_string, bytes_to_human_readable
-from config import MAX_CSV_SIZE, DEFAULT_ENCODING, OUTPUT_DIR, DEFAULT_MISSING_VALUE
+from config import (MAX_CSV_SIZE, DEFAULT_ENCODING, OUTPUT_DIR, DEFAULT_MISSING_VALUE, CSV_CHUNK_ROWS,
+                    CSV_BLOCK_SIZE, MIN_PARALLEL_CLEAN_ROWS)
 
+import numpy as np
 import pandas as pd
 
+# Public since pandas 2.2, adds pandas' own guess to the date formats tried
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    guess_datetime_format = None
+
+# Optional multithreaded CSV reader and writer, falls back to the pandas C parser and to_csv()
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# Runs of whitespace (tabs, newlines, repeated spaces) collapsed by _clean_whitespace()
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Currency symbols and thousands separators stripped by _clean_prices()
+_PRICE_RE = re.compile(r'[$€£¥,]')
+
+# Common date formats tried by _date_format(), ties go to the earlier one
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d')
+
+# Values sampled from each date column to pick its format
+_DATE_SAMPLE_SIZE = 100
+
+# Rows searched for those samples before the formats are picked anyway. Chunks
+# are held back until then, so the formats don't depend on where chunks split.
+_DATE_SAMPLE_ROWS = 100_000
+
+# Title Case columns with at most this share of distinct values (status fields)
+# are cleaned once per distinct value instead of once per row
+_LOW_CARDINALITY_RATIO = 0.5
+
+# Column-name keywords and the category they give a column in _classify_columns(),
+# first match wins. Status casing beats email and email beats name, so e.g.
+# Email_Status is Title Cased and Name_Email lowercased.
+_COLUMN_CATEGORIES = (
+    ('date', re.compile(r'date|time|day')),
+    ('price', re.compile(r'price|cost|amount|total|fee')),
+    ('title', re.compile(r'status')),
+    ('email', re.compile(r'email')),
+    ('title', re.compile(r'name')),
+)
+
+# Column-name keywords and the default _classify_columns() picks for their missing
+# values, first match wins. Columns matching none get DEFAULT_MISSING_VALUE.
+_MISSING_DEFAULTS = (
+    ('Unknown Product', re.compile(r'product')), # Products get 'Unknown Product'
+    ('Unknown', re.compile(r'name')), # Names get 'Unknown'
+    ('no-email@provided.com', re.compile(r'email')), # Emails get placeholder
+    ('Pending', re.compile(r'status')), # Status gets 'Pending'
+    (1, re.compile(r'quantity|count')), # Quantities/counts get 1
+    (0.00, re.compile(r'price|cost|amount|total|fee')), # Prices/amounts get 0.00
+)
+
 class CSVCleaner(BaseTool):
     """
     Tool for cleaning messy CSV files.
@@ -98,29 +160,30 @@ class CSVCleaner(BaseTool):
         filepath = Path(filepath)
 
         try:
-            # Read CSV file
             self.logger.info(f"Reading CSV file with encoding: {DEFAULT_ENCODING}")
-            df = pd.read_csv(filepath, encoding=DEFAULT_ENCODING, dtype=str, keep_default_na=False)
 
-            # Convert empty strings to NaN for proper handling
-            df = df.replace('', pd.NA)
+            output_path = self._output_path(filepath)
 
-            self.stats["original_rows"] = len(df)
-            self.logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+            try:
+                columns = None
 
-            # Clean the data
-            df = self._remove_duplicates(df)
-            df = self._remove_empty_rows(df)
-            df = self._clean_prices(df)
-            df = self._standardize_dates(df)
-            df = self._handle_missing_values(df)
-            df = self._standardize_text(df)
-            df = self._clean_text_fields(df)
+                # Parse with pyarrow when available, the pandas parser handles what it rejects
+                if pacsv is not None:
+                    try:
+                        columns = self._clean_chunks(self._arrow_chunks(filepath), output_path)
+                    except pa.ArrowInvalid as e:
+                        self.logger.warning(f"pyarrow could not parse the file ({e}), retrying with the pandas parser")
 
-            self.stats["final_rows"] = len(df)
+                if columns is None:
+                    columns = self._clean_chunks(self._pandas_chunks(filepath), output_path)
 
-            # Save cleaned file
-            output_path = self._save_cleaned_file(df, filepath)
+            except BaseException:
+                # Don't leave a partial output file behind
+                output_path.unlink(missing_ok=True)
+                raise
+
+            self.logger.info(f"Loaded {self.stats['original_rows']} rows, {len(columns)} columns")
+            self.logger.info(f"Saved cleaned file to: {output_path}")
 
             # Log summary
             self._log_summary()
@@ -142,14 +205,233 @@ class CSVCleaner(BaseTool):
             self.logger.error(f"Unexpected error: {e}")
             return None
         
+    def _pandas_chunks(self, filepath):
+        """
+        Read a CSV file in chunks with the pandas C parser.
+
+        Args:
+            filepath: Path to the CSV file
+
+        Yields:
+            DataFrame: Up to CSV_CHUNK_ROWS rows of string columns, empty cells as ''
+        """
+
+        with pd.read_csv(filepath, encoding=DEFAULT_ENCODING, dtype=str, keep_default_na=False,
+                         chunksize=CSV_CHUNK_ROWS) as reader:
+            for df in reader:
+                # Short rows are padded with NaN, make those empty strings like other empty cells
+                if df.isna().to_numpy().any():
+                    df = df.fillna('')
+                yield df
+
+    def _arrow_chunks(self, filepath):
+        """
+        Read a CSV file in blocks with the pyarrow streaming reader.
+
+        Args:
+            filepath: Path to the CSV file
+
+        Yields:
+            DataFrame: One CSV_BLOCK_SIZE block of string columns, empty cells as ''
+
+        Raises:
+            pa.ArrowInvalid: If pyarrow can't parse the file the way pandas would
+        """
+
+        read_options = pacsv.ReadOptions(encoding=DEFAULT_ENCODING, block_size=CSV_BLOCK_SIZE)
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+
+        # Read the header first so every column can be typed as string
+        with pacsv.open_csv(filepath, read_options=read_options, parse_options=parse_options) as reader:
+            names = reader.schema.names
+
+        # pandas renames duplicate and blank headers, leave those files to it
+        if len(set(names)) != len(names) or '' in names:
+            raise pa.ArrowInvalid("duplicate or blank column names")
+
+        convert_options = pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=False
+        )
+
+        with pacsv.open_csv(filepath, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options) as reader:
+            empty = True
+            for batch in reader:
+                empty = False
+                # Same dtype as read_csv(dtype=str), object on pandas 2 and str on pandas 3.
+                # ArrowDtype strings (dtype_backend='pyarrow') reject the numeric defaults
+                # _handle_missing_values() fills in, and their == '' gives NA, not False.
+                yield batch.to_pandas()
+
+        # A header-only file still produces one (empty) chunk
+        if empty:
+            yield pd.DataFrame(columns=names, dtype=str)
+
+    def _clean_chunks(self, chunks, output_path):
+        """
+        Clean a stream of chunks and write them to the output file.
+
+        Args:
+            chunks: Iterable of DataFrames from _pandas_chunks() or _arrow_chunks()
+            output_path: Path from _output_path()
+
+        Returns:
+            Index: Column names of the file
+        """
+
+        # Fresh statistics, chunks add to them
+        self.stats = dict.fromkeys(self.stats, 0)
+        self._seen_rows = np.empty(0, dtype=np.uint64)
+        self._date_formats = {}
+        self._date_samples = None
+        self._date_sample_rows = 0
+
+        pending = [] # Chunks held back until the date formats are picked
+        header = True
+
+        for i, df in enumerate(chunks):
+            self.stats["original_rows"] += len(df)
+
+            if i == 0:
+                # Classify columns by name once, every pass dispatches on it
+                columns = df.columns
+                categories, defaults = self._classify_columns(columns)
+                self._date_samples = {col: [] for col, category in categories.items() if category == 'date'}
+
+            # Drop rows first so every later pass traverses fewer of them
+            df = self._remove_duplicates(df)
+            df = self._remove_empty_rows(df)
+
+            if self._date_samples is not None:
+                pending.append(df)
+                if not self._sample_dates(df):
+                    continue
+
+            # Clean and stream the chunks to the output file
+            for ready in pending or [df]:
+                self._clean_and_save(ready, categories, defaults, output_path, header)
+                header = False
+            pending = []
+
+        # The file ended before the samples filled up
+        if pending:
+            self._pick_date_formats()
+            for ready in pending:
+                self._clean_and_save(ready, categories, defaults, output_path, header)
+                header = False
+
+        return columns
+
+    def _classify_columns(self, columns):
+        """
+        Classify each column by name, vectorized over the lowercased header.
+
+        Args:
+            columns: Column names of the file
+
+        Returns:
+            tuple: (categories, defaults) dicts, column name -> 'date', 'price', 'email',
+                   'title' or 'other', and column name -> missing-value default
+        """
+
+        cols_lower = columns.str.lower()
+        matches = [cols_lower.str.contains(pattern) for _, pattern in _COLUMN_CATEGORIES]
+        names = [category for category, _ in _COLUMN_CATEGORIES]
+        categories = dict(zip(columns, np.select(matches, names, default='other').tolist()))
+
+        # Defaults mix strings and numbers, so select their index and look them up
+        matches = [cols_lower.str.contains(pattern) for _, pattern in _MISSING_DEFAULTS]
+        picked = np.select(matches, range(len(_MISSING_DEFAULTS)), default=-1).tolist()
+        defaults = {col: _MISSING_DEFAULTS[i][0] if i >= 0 else DEFAULT_MISSING_VALUE
+                    for col, i in zip(columns, picked)}
+
+        return categories, defaults
+
+    def _clean_and_save(self, df, categories, defaults, output_path, header):
+        """
+        Clean the values of a deduplicated chunk and append it to the output file.
+
+        Args:
+            df: Chunk from _remove_empty_rows()
+            categories: Column categories from _classify_columns()
+            defaults: Missing-value defaults from _classify_columns()
+            output_path: Path from _output_path()
+            header: True for the first chunk written
+        """
+
+        # Clean the data
+        df = self._clean_prices(df, categories)
+        df = self._standardize_dates(df, categories)
+        df = self._handle_missing_values(df, categories, defaults)
+        df = self._standardize_text(df, categories)
+
+        self.stats["final_rows"] += len(df)
+
+        # Stream the cleaned chunk to the output file
+        self._save_cleaned_file(df, output_path, header=header)
+
+    def _sample_dates(self, df):
+        """
+        Collect date values from a chunk until the date formats can be picked.
+
+        Sampling stops once every date column has _DATE_SAMPLE_SIZE non-blank
+        values or _DATE_SAMPLE_ROWS rows have been searched, whichever is first.
+
+        Args:
+            df: Chunk from _remove_empty_rows()
+
+        Returns:
+            bool: True once the formats have been picked
+        """
+
+        window = df.iloc[:_DATE_SAMPLE_ROWS - self._date_sample_rows]
+        self._date_sample_rows += len(window)
+
+        full = True
+        for col, values in self._date_samples.items():
+            needed = _DATE_SAMPLE_SIZE - sum(map(len, values))
+            if needed > 0:
+                present = window[col][(window[col] != '') & window[col].notna()]
+                values.append(present.head(needed))
+                full &= len(present) >= needed
+
+        if not full and self._date_sample_rows < _DATE_SAMPLE_ROWS:
+            return False
+
+        self._pick_date_formats()
+        return True
+
+    def _pick_date_formats(self):
+        """Pick each date column's format from the values collected by _sample_dates()."""
+
+        for col, values in self._date_samples.items():
+            sample = pd.concat(values) if values else None
+            if sample is not None and len(sample):
+                self._date_formats[col] = self._date_format(sample)
+
+        self._date_samples = None
+
     def _remove_duplicates(self, df):
-        """Remove duplicate rows from the Dataframe."""
+        """Remove duplicate rows from the Dataframe, including rows seen in earlier chunks."""
         before = len(df)
-        df = df.drop_duplicates()
+
+        # One 64-bit hash per row, hashed column by column in C. A collision
+        # between distinct rows is ~1e-8 likely even for a million rows.
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+        # Keep the first row of each hash, then drop rows kept from an earlier chunk
+        repeated = pd.Index(row_hashes).duplicated()
+        if len(self._seen_rows):
+            repeated |= np.isin(row_hashes, self._seen_rows)
+
+        df = df[~repeated]
+        self._seen_rows = np.concatenate([self._seen_rows, row_hashes[~repeated]])
+
         after = len(df)
 
         removed = before - after
-        self.stats["duplicates_removed"] = removed
+        self.stats["duplicates_removed"] += removed
 
         if removed > 0:
             row_word = "row" if removed == 1 else "rows"
@@ -160,11 +442,11 @@ class CSVCleaner(BaseTool):
     def _remove_empty_rows(self, df):
         """Remove completely empty rows."""
         before = len(df)
-        df = df.dropna(how='all')
+        df = df[~(df == '').all(axis=1)]
         after = len(df)
 
         removed = before - after
-        self.stats["empty_rows_removed"] = removed
+        self.stats["empty_rows_removed"] += removed
 
         if removed > 0:
             row_word = "row" if removed == 1 else "rows"
@@ -172,39 +454,31 @@ class CSVCleaner(BaseTool):
 
         return df
     
-    def _standardize_text(self, df):
+    def _standardize_text(self, df, categories):
         """
-        Standardize text formatting across common column types.
+        Clean whitespace and standardize text formatting in one pass per column.
+        - All text: whitespace runs collapsed, leading/trailing trimmed
         - Names: Title Case
         - Emails: lowercase
         - Status fields: Title Case
+
+        Args:
+            df: DataFrame to clean
+            categories: Column categories from _classify_columns(), 'email' columns are
+                        lowercased and 'title' (name and status) columns Title Cased
         """ 
 
-        changes_made = 0
+        # Find text columns, pandas 3 loads strings as the str dtype instead of object
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
 
-        # Find columns that look like names (contain 'name' in column name)
-        name_columns = [col for col in df.columns if 'name' in col.lower()]
-        for col in name_columns:
-            if df[col].dtype == 'object': 
-                # Apply title case, leaving NaN unchanged
-                df[col] = df[col].apply(lambda x: x.title() if pd.notna(x) else x)
-                changes_made += 1
-        
-        # Find columns that look like emails
-        email_columns = [col for col in df.columns if 'email' in col.lower()]
-        for col in email_columns:
-            if df[col].dtype == 'object':
-               # Apply title case, leaving NaN unchanged
-                df[col] = df[col].apply(lambda x: x.lower() if pd.notna(x) else x)
-                changes_made += 1
+        df = self._map_columns(df, text_columns, lambda values: self._clean_text(values, categories[values.name]))
 
-        # Find columns that look like status fields
-        status_columns = [col for col in df.columns if 'status' in col.lower()]
-        for col in status_columns:
-            if df[col].dtype == 'object':
-                # Apply title case, leaving NaN unchanged
-                df[col] = df[col].apply(lambda x: x.title() if pd.notna(x) else x)
-                changes_made += 1
+        cleaned_count = len(text_columns)
+        changes_made = sum(categories[col] in ('email', 'title') for col in text_columns)
+
+        if cleaned_count > 0:
+            column_word = "column" if cleaned_count == 1 else "columns"
+            self.logger.info(f"Cleaned whitespace in {cleaned_count} text {column_word}")
 
         if changes_made > 0:
             column_word = "column" if changes_made == 1 else "columns"
@@ -212,23 +486,54 @@ class CSVCleaner(BaseTool):
 
         return df
 
-    def _standardize_dates(self, df):
+    def _clean_text(self, values, category):
         """
-        Standardize date formats to YYYY-MM-DD.
-        Handles multiple input formats automatically.
+        Clean whitespace and case of one text column.
+
+        Args:
+            values: Series of text values
+            category: Column category from _classify_columns()
+
+        Returns:
+            Series: Cleaned values
+        """
+
+        # Whitespace and case in one chained expression, NaN propagates through .str
+        if category == 'email':
+            return self._clean_whitespace(values).str.lower()
+        if category == 'title':
+            return self._title_case(values)
+        return self._clean_whitespace(values)
+
+    def _standardize_dates(self, df, categories):
         """
+        Standardize date formats to YYYY-MM-DD.
+        Each column is parsed with the format that fits most of the values
+        sampled by _sample_dates(), the same for every chunk.
 
-        # Find columns that look like dates
-        date_columns = [col for col in df.columns if any(
-            keyword in col.lower() for keyword in ['date', 'time', 'day']
-        )]
+        Args:
+            df: DataFrame to clean
+            categories: Column categories from _classify_columns(), 'date' columns are parsed
+        """
 
         changes_made = 0
 
-        for col in date_columns:
+        for col, category in categories.items():
+            if category != 'date':
+                continue
+
             try:
-                # Convert to datetime (handles both text and datetime input)
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+                # Columns blank in every sampled row take the format from
+                # the first later chunk that has values
+                if col not in self._date_formats:
+                    present = df[col][(df[col] != '') & df[col].notna()]
+                    if len(present):
+                        self._date_formats[col] = self._date_format(present.head(_DATE_SAMPLE_SIZE))
+
+                # Convert to datetime (handles both text and datetime input),
+                # cache parses each distinct date string once
+                df[col] = pd.to_datetime(df[col], format=self._date_formats.get(col), errors='coerce',
+                                         cache=True)
                 # Format as string
                 df[col] = df[col].dt.strftime('%Y-%m-%d')
                 # Replace NaT with empty string
@@ -243,33 +548,46 @@ class CSVCleaner(BaseTool):
 
         return df
     
-    def _clean_prices(self, df):
+    def _date_format(self, sample):
         """
-        Clean price/currency columns by removing symbols and converting to numbers.
-        Handles: $, €, £, ¥, and commas
+        Pick the date format that parses the most values of a sample.
+
+        Args:
+            sample: Series of non-blank values from a date column
+
+        Returns:
+            str: Format from _DATE_FORMATS or pandas' guess, None to let
+                 pandas infer it if no format parses any value
         """
 
-        # Find columns that look like prices
-        price_columns = [col for col in df.columns if any(
-            keyword in col.lower() for keyword in ['price', 'cost', 'amount', 'total', 'fee']
-        )]
+        formats = list(_DATE_FORMATS)
 
-        changes_made = 0
+        # Also try the format pandas would infer from the first value
+        if guess_datetime_format is not None:
+            guessed = guess_datetime_format(str(sample.iloc[0]))
+            if guessed is not None and guessed not in formats:
+                formats.append(guessed)
 
-        for col in price_columns:
-            # Convert to string
-            df[col] = df[col].astype(str)
+        parsed = [pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum() for fmt in formats]
+        best = max(range(len(formats)), key=parsed.__getitem__)
 
-            # Remove currency symbols and commas
-            df[col] = df[col].str.replace('$', '', regex=False)
-            df[col] = df[col].str.replace('€', '', regex=False)
-            df[col] = df[col].str.replace('£', '', regex=False)
-            df[col] = df[col].str.replace('¥', '', regex=False)
-            df[col] = df[col].str.replace(',', '', regex=False)
+        return formats[best] if parsed[best] > 0 else None
 
-            # Convert to numeric
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            changes_made += 1
+    def _clean_prices(self, df, categories):
+        """
+        Clean price/currency columns by removing symbols and converting to numbers.
+        Handles: $, €, £, ¥, and commas
+
+        Args:
+            df: DataFrame to clean
+            categories: Column categories from _classify_columns(), 'price' columns are cleaned
+        """
+
+        price_columns = [col for col, category in categories.items() if category == 'price']
+
+        df = self._map_columns(df, price_columns, self._clean_price)
+
+        changes_made = len(price_columns)
 
         if changes_made > 0:
             column_word = "column" if changes_made == 1 else "columns"
@@ -277,99 +595,143 @@ class CSVCleaner(BaseTool):
 
         return df
     
-    def _handle_missing_values(self, df):
-        """Fill missing values with intelligent defaults based on column type and name."""
-        
-        missing_count = df.isna().sum().sum()
+    def _clean_price(self, values):
+        """
+        Convert one price column to floats.
 
-        if missing_count == 0:
-            return df
+        Args:
+            values: Series of price strings
+
+        Returns:
+            Series: Float prices, NaN where a value is not a number
+        """
+
+        # Convert to string, object and pandas string columns already hold the loaded strings
+        if values.dtype != object and not isinstance(values.dtype, pd.StringDtype):
+            values = values.astype(str)
+
+        # Remove currency symbols and commas in a single regex pass
+        values = values.str.replace(_PRICE_RE, '', regex=True)
+
+        # Convert to numeric, always float so every chunk writes prices the same way
+        return pd.to_numeric(values, errors='coerce').astype(float)
+
+    def _map_columns(self, df, columns, transform):
+        """
+        Replace each of the given columns with transform(column).
+
+        On machines with several CPUs, large chunks have their columns
+        transformed across threads. pandas and Arrow string kernels
+        release the GIL for part of their work.
+
+        Args:
+            df: DataFrame to clean
+            columns: Columns to transform
+            transform: Function taking and returning a Series
+
+        Returns:
+            DataFrame: df with the transformed columns
+        """
+
+        # Take the columns out on this thread, workers only see their own Series
+        inputs = [df[col] for col in columns]
+
+        n_workers = min(os.cpu_count() or 1, len(inputs))
+        if n_workers > 1 and len(df) >= MIN_PARALLEL_CLEAN_ROWS:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(transform, inputs))
+        else:
+            results = [transform(values) for values in inputs]
+
+        for col, values in zip(columns, results):
+            df[col] = values
+
+        return df
+
+    def _handle_missing_values(self, df, categories, defaults):
+        """
+        Fill missing values with intelligent defaults based on column type and name.
+
+        Empty strings in text columns and NaN in numeric columns count as missing.
+
+        Args:
+            df: DataFrame to clean
+            categories: Column categories from _classify_columns(), 'date' columns were
+                        handled by _standardize_dates() and are left as is
+            defaults: Missing-value defaults from _classify_columns()
+        """
         
-        filled = 0
+        missing_count = 0
+
+        # One missing-value mask and count for the whole chunk
+        missing = (df == '') | df.isna()
+        na_counts = missing.sum()
 
-        # Smart defaults for common column types
         for col in df.columns:
-            if df[col].isna().sum() == 0:
+            if categories[col] == 'date':
+                continue # Unparseable dates stay blank
+
+            missing_in_col = int(na_counts[col])
+
+            if missing_in_col == 0:
                 continue # Skip columns with no missing values
 
-            col_lower = col.lower()
-
-            # Products get 'Unknown Product'
-            if 'product' in col_lower:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna('Unknown Product')
-                filled += missing_in_col
-
-            # Names get 'Unknown'
-            elif 'name' in col_lower:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna('Unknown')
-                filled += missing_in_col
-
-            # Emails get placeholder
-            elif 'email' in col_lower:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna('no-email@provided.com')
-                filled += missing_in_col
-
-            # Status gets 'Pending'
-            elif 'status' in col_lower:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna('Pending')
-                filled += missing_in_col
-
-            # Quantities/counts get 1
-            elif 'quantity' in col_lower or 'count' in col_lower:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna(1)
-                filled += missing_in_col
-
-            # Prices/amounts get 0.00
-            elif any(word in col_lower for word in ['price', 'cost', 'amount', 'total', 'fee']):
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna(0.00)
-                filled += missing_in_col
-
-            # Everything else gets empty string
-            else:
-                missing_in_col = df[col].isna().sum()
-                df[col] = df[col].fillna(DEFAULT_MISSING_VALUE)
-                filled += missing_in_col
+            # Smart defaults for common column types
+            df[col] = df[col].where(~missing[col], defaults[col])
+            missing_count += missing_in_col
+
+        if missing_count == 0:
+            return df
                     
-        self.stats["missing_values_filled"] = missing_count
+        self.stats["missing_values_filled"] += missing_count
 
-        if filled > 0:
-            value_word = "value" if filled == 1 else "values"
-            self.logger.info(f"Filled {filled} missing {value_word} with intelligent defaults.")
+        value_word = "value" if missing_count == 1 else "values"
+        self.logger.info(f"Filled {missing_count} missing {value_word} with intelligent defaults.")
 
         return df
 
-    
-    
-    def _clean_text_fields(self, df):
-        """Clean whitespace in text fields using utils.clean_string()."""
-        
-        cleaned_count = 0
-
-        # Find text columns
-        text_columns = df.select_dtypes(include=['object']).columns
-
-        # Clean each text column
-        for column in text_columns:
-            # Apply clean_string to each value in the column
-            df[column] = df[column].apply(
-                lambda x: clean_string(str(x)) if pd.notna(x) else x
-            )
-            cleaned_count += 1
-        
-        if cleaned_count > 0:
-            column_word = "column" if cleaned_count == 1 else "columns"
-            self.logger.info(f"Cleaned whitespace in {cleaned_count} text {column_word}")
+    def _clean_whitespace(self, values):
+        """
+        Clean whitespace in a text column, same result as utils.clean_string().
 
-        return df
+        Args:
+            values: Series of text values
+
+        Returns:
+            Series: Values with whitespace runs collapsed and trimmed
+        """
+
+        # Columns filled with numeric defaults hold mixed types, stringify and clean
+        # each non-NaN value in a single pass
+        if not pd.api.types.is_string_dtype(values):
+            return values.map(lambda x: clean_string(str(x)), na_action='ignore')
+
+        # Collapse whitespace runs to one space and trim, in one vectorized pass
+        return values.str.replace(_WHITESPACE_RE, ' ', regex=True).str.strip()
     
-    def _save_cleaned_file(self, df, original_filepath):
-        """Save the cleaned dataframe to a new CSV file."""
+    def _title_case(self, values):
+        """
+        Clean whitespace and Title Case a column, per distinct value when there are few.
+
+        Args:
+            values: Series of text values
+
+        Returns:
+            Series: Cleaned Title Case values, NaN kept as NaN
+        """
+
+        codes, uniques = pd.factorize(values)
+        if len(uniques) > len(values) * _LOW_CARDINALITY_RATIO:
+            return self._clean_whitespace(values).str.title()
+
+        # Clean the distinct values, then map back by code. The trailing NaN
+        # is picked up by code -1 (missing values).
+        cleaned = self._clean_whitespace(pd.Series(uniques, dtype=object)).str.title()
+        cleaned = np.append(cleaned.to_numpy(dtype=object), np.nan)
+        return pd.Series(cleaned[codes], index=values.index, name=values.name, dtype=object)
+
+    def _output_path(self, original_filepath):
+        """Build the timestamped output path for a cleaned file."""
         
         # Ensure output directory exists (using utils.py and config.py)
         create_directory(OUTPUT_DIR)
@@ -377,14 +739,68 @@ class CSVCleaner(BaseTool):
         # Generate output filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"{original_filepath.stem}_cleaned_{timestamp}.csv"
-        output_path = OUTPUT_DIR / output_filename
+        return OUTPUT_DIR / output_filename
+
+    def _save_cleaned_file(self, df, output_path, header=True):
+        """
+        Save a cleaned dataframe chunk to the output CSV file.
+
+        Args:
+            df: Cleaned chunk
+            output_path: Path from _output_path()
+            header: True for the first chunk, which creates the file and writes the header,
+                    False to append
+        """
+
+        # Arrow only writes UTF-8 with LF line endings. to_csv() quotes a lone empty value
+        # (a blank line would read back as no row), so single-column chunks stay with it
+        if (pacsv is not None and codecs.lookup(DEFAULT_ENCODING).name == 'utf-8'
+                and os.linesep == '\n' and len(df.columns) > 1):
+            rows = self._arrow_rows(df)
+            if rows is not None:
+                with open(output_path, 'wb' if header else 'ab') as f:
+                    if header:
+                        # Arrow always quotes header names, to_csv() only when needed
+                        f.write(df.head(0).to_csv(index=False).encode(DEFAULT_ENCODING))
+                    f.write(rows)
+                return
 
         # Save to CSV
-        df.to_csv(output_path, index=False, encoding=DEFAULT_ENCODING)
+        df.to_csv(output_path, mode='w' if header else 'a', header=header, index=False,
+                  encoding=DEFAULT_ENCODING)
 
-        self.logger.info(f"Saved cleaned file to: {output_path}")
+    def _arrow_rows(self, df):
+        """
+        Write the rows of a cleaned chunk as CSV bytes with pyarrow.csv.write_csv().
+
+        Values are written unquoted, which is what to_csv() does for every value without
+        a comma, quote or line break. Arrow refuses to write those, and the chunk is left
+        to to_csv() so both writers give the same bytes. Prices and columns holding numeric
+        defaults are stringified first, since Arrow formats floats differently (0 vs 0.0).
+
+        Args:
+            df: Cleaned chunk
+
+        Returns:
+            bytes: CSV rows without a header, or None if a value needs quoting
+        """
+
+        columns = []
+        for col in df.columns:
+            values = df[col]
+            if not pd.api.types.is_string_dtype(values):
+                values = values.astype(str).where(values.notna(), '') # NaN is written blank
+            columns.append(pa.array(values.to_numpy(dtype=object), type=pa.string()))
+
+        table = pa.Table.from_arrays(columns, names=[str(col) for col in df.columns])
+        sink = pa.BufferOutputStream()
+        try:
+            pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=False,
+                                                                          quoting_style='none'))
+        except pa.ArrowInvalid:
+            return None
 
-        return output_path
+        return sink.getvalue().to_pybytes()
 
     def _log_summary(self):
         """Log a summary of cleaning operations."""